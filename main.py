@@ -3,6 +3,161 @@ import git
 import javalang
 import re
 import json
+import hashlib
+import mmap
+import pickle
+import shutil
+import subprocess
+import functools
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# pygit2 (libgit2) fetches in process instead of running git subprocesses
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# pyahocorasick finds all controller annotations in a single pass over a file
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson serializes the results much faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# tree-sitter parses Java in native code, and is used instead of javalang when installed
+try:
+    from tree_sitter import Parser
+    from tree_sitter_languages import get_language
+except ImportError:
+    Parser = None
+
+_java_parser = None
+if Parser is not None:
+    # tree_sitter_languages only works with tree_sitter < 0.22, fall back to javalang otherwise
+    try:
+        # tree_sitter_languages still loads grammars through a deprecated tree_sitter API
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            _JAVA_LANGUAGE = get_language('java')
+        # Annotations with arguments on method declarations, the annotation name is checked in Python
+        _ENDPOINT_QUERY = _JAVA_LANGUAGE.query('''
+            (method_declaration
+              (modifiers
+                (annotation
+                  name: (identifier) @annotation
+                  arguments: (annotation_argument_list) @arguments))
+              name: (identifier) @method)
+        ''')
+        _java_parser = Parser()
+        _java_parser.set_language(_JAVA_LANGUAGE)
+    except Exception:
+        _java_parser = None
+
+# Type body node -> the declaration node types it can belong to, in tree-sitter's Java grammar.
+# enum_body_declarations sits in an enum_body, so its declaration is two levels up.
+_TREE_SITTER_TYPE_BODIES = {
+    'class_body': ('class_declaration', 'record_declaration'),
+    'interface_body': ('interface_declaration',),
+    'annotation_type_body': ('annotation_type_declaration',),
+    'enum_body_declarations': ('enum_declaration',),
+}
+
+_MAPPING_ANNOTATIONS = frozenset({
+    'GetMapping', 'PostMapping', 'PutMapping',
+    'DeleteMapping', 'PatchMapping', 'RequestMapping'
+})
+# Annotation params holding the URI, and literal values that don't count as a URI
+_URI_PARAM_NAMES = ('value', 'path')
+_EMPTY_URIS = frozenset({'""', "''"})
+_EMPTY_ARRAY_URIS = frozenset({'""', "''", '{}'})
+
+# Parsed endpoints are cached on disk keyed on (file extension, content hash),
+# so files unchanged since the last run are not parsed again.
+# Bump _CACHE_VERSION whenever parsing changes what gets counted. The cache is also
+# dropped when the Java parser in use changes, since they don't count exactly alike.
+_CACHE_FILE = '.endpoint_cache.pkl'
+_CACHE_VERSION = 1
+_CACHE_BACKEND = 'javalang' if _java_parser is None else 'tree-sitter'
+_endpoint_cache = {}
+# Entries hit or created by this run, the only ones saved for the next run.
+# Pool workers drain theirs after each file and send them back to the main process.
+_used_cache_entries = {}
+# Messages from pool workers are buffered and printed by the main process, None when not a worker
+_worker_messages = None
+
+# Attempts to match mapping annotations with a non-empty URI like:
+# @GetMapping("/users")
+# @PostMapping(value = "/users")
+# @RequestMapping(path = "/api/users")
+# @GetMapping(["/users", "/all-users"])
+# @GetMapping(value = ["/users", "/all-users"])
+#
+# Pattern explanation:
+# @(?P<ann>...) - the annotation, captured by name
+# \s* - optional whitespace
+# \( - opening parenthesis
+# (?:(?:value|path)\s*=\s*)? - optional "value =" or "path ="
+# "[^"]+"|'[^']+' - a simple string value @GetMapping("/path")
+# \[[^\]]+\] - or an array value @GetMapping(["/path1", "/path2"])
+# Each value stops at its own closing delimiter, so an empty value like @GetMapping("")
+# can't run on into (and swallow) the next annotation.
+_MAPPING_RE = re.compile(
+    r'@(?P<ann>GetMapping|PostMapping|PutMapping|DeleteMapping|PatchMapping|RequestMapping)'
+    r'\s*\(\s*(?:(?:value|path)\s*=\s*)?(?:"[^"]+"|\'[^\']+\'|\[[^\]]+\])'
+)
+
+# Method declaration following an annotation, capturing the method name
+_METHOD_RE = re.compile(
+    r'(?:public|private|protected)?\s+(?:static\s+)?(?:\w+(?:<[^>]+>)?(?:\[\])?\s+)?(\w+)\s*\('
+)
+
+# Only JVM sources and build files are ever read, so clones skip everything else
+_SPARSE_CHECKOUT_PATTERNS = ['*.java', '*.groovy', '*.kt', '*.scala', 'pom.xml', 'build.gradle*']
+
+def pull_latest(clone_dir):
+    """
+    Fetches origin and hard resets the current branch to its upstream.
+    Uses pygit2 when available, otherwise (or for shallow clones) runs git pull.
+
+    :param clone_dir: Path to the cloned repository
+    """
+    if pygit2 is not None:
+        repo = pygit2.Repository(clone_dir)
+        # libgit2 can't fetch the blobs partial clones leave out, so those go through git
+        if not repo.is_shallow:
+            repo.remotes['origin'].fetch()
+            upstream = repo.branches.local[repo.head.shorthand].upstream
+            repo.reset(upstream.target, pygit2.GIT_RESET_HARD)
+            return
+
+    git.Repo(clone_dir).git.pull()
+
+def sparse_clone(repo_url, clone_dir):
+    """
+    Shallow, blobless clone of the tip commit that only checks out the files
+    matching _SPARSE_CHECKOUT_PATTERNS.
+
+    :param repo_url: URL of the repository
+    :param clone_dir: Path to clone into
+    :return: git.Repo object
+    """
+    repo = git.Repo.clone_from(repo_url, clone_dir,
+                               multi_options=['--depth=1', '--filter=blob:none', '--no-checkout'])
+    try:
+        repo.git.sparse_checkout('set', '--no-cone', *_SPARSE_CHECKOUT_PATTERNS)
+        repo.git.checkout()
+    except Exception:
+        # Don't leave an empty worktree behind for later runs to mistake for a clone
+        repo.close()
+        shutil.rmtree(clone_dir, ignore_errors=True)
+        raise
+    return repo
 
 def clone_repo(repo_url):
     """
@@ -19,23 +174,55 @@ def clone_repo(repo_url):
             print('Repo already cloned, skipping clone step...')
             repo = git.Repo(clone_dir)
             print('Pulling latest changes...')
-            repo.git.pull()
+            try:
+                pull_latest(clone_dir)
+            except Exception as e:
+                # Still analyze the existing checkout, e.g. when offline
+                print(f"Failed to pull latest changes into {clone_dir}: {e}")
         else:
             print(f"Cloning {repo_url} into {clone_dir}...")
-            repo = git.Repo.clone_from(repo_url, clone_dir)
+            repo = sparse_clone(repo_url, clone_dir)
             print(f"Successfully cloned {repo_url} to {clone_dir}")
     except Exception as e:
         print(f"Failed to clone {repo_url} to {clone_dir}: {e}")
     return repo
 
 
+def _scan(path, skipped_dirs=()):
+    """
+    Walk a directory tree top-down like os.walk, but using the file type
+    os.scandir already read from the directory instead of stat'ing each entry.
+
+    :param path: Directory to walk
+    :param skipped_dirs: Directory names to not descend into
+    :return: Generator of (root, dirs, files) tuples
+    """
+    dirs = []
+    files = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skipped_dirs:
+                        dirs.append(entry.name)
+                else:
+                    files.append(entry.name)
+    except OSError:
+        return
+
+    yield path, dirs, files
+
+    for d in dirs:
+        yield from _scan(os.path.join(path, d), skipped_dirs)
+
+
 def get_microservice_dirs(repo: git.Repo) -> list:
     """
     Find directories likely to be microservices.
     Indicators being:
     - pom.xml (Maven) or build.gradle (Gradle)
     - Contains src/main/java structure
-    - Top-level or second-level directories
+    - Top-level directories (nested modules are crawled as part of their top-level directory)
 
     :param repo: git.Repo object
     :return: List of paths likely to be microservices.
@@ -43,16 +230,17 @@ def get_microservice_dirs(repo: git.Repo) -> list:
     repo_root = repo.working_dir
     microservices = []
 
-    # Check top-level and one level deep
-    for root, dirs, files in os.walk(repo_root):
-        # Skip .git
-        if '.git' in dirs:
-            dirs.remove('.git')
-
-        # Only check up to 2 levels deep
-        depth = root[len(repo_root):].count(os.sep)
-        if depth > 1:
-            dirs[:] = []  # Don't go deeper
+    # List the repo root, then only the files of each top-level directory (skipping .git),
+    # rather than walking into their subtrees
+    with os.scandir(repo_root) as it:
+        top_level_dirs = [entry for entry in it
+                          if entry.is_dir(follow_symlinks=False) and entry.name != '.git']
+
+    for top_level_dir in top_level_dirs:
+        try:
+            with os.scandir(top_level_dir.path) as it:
+                files = {entry.name for entry in it if entry.is_file()}
+        except OSError:
             continue
 
         # Check if this directory looks like a microservice
@@ -60,10 +248,7 @@ def get_microservice_dirs(repo: git.Repo) -> list:
         has_gradle = 'build.gradle' in files or 'build.gradle.kts' in files
 
         if has_pom or has_gradle:
-            rel_path = os.path.relpath(root, repo_root)
-            if rel_path == '.':
-                continue
-            microservices.append(rel_path)
+            microservices.append(top_level_dir.name)
 
     return microservices
 
@@ -82,6 +267,79 @@ def remove_java_comments(content):
 
     return content
 
+def find_annotation_candidates(search_path, annotations, skipped_dirs, file_extensions):
+    """
+    Find files that mention any of the annotations using a single ripgrep call,
+    so only those files need to be read and checked in Python.
+
+    :param search_path: Full path to directory to search
+    :param annotations: Annotation strings to search for (e.g. '@RestController')
+    :param skipped_dirs: Directory names to exclude
+    :param file_extensions: File extensions to include (e.g. '.java')
+    :return: Set of full file paths, or None if ripgrep is unavailable or fails
+    """
+    rg = shutil.which('rg')
+    if rg is None:
+        return None
+
+    cmd = [rg, '-l', '--no-messages', '--no-ignore', '--hidden', '-F']
+    for annotation in annotations:
+        cmd += ['-e', annotation]
+    for ext in file_extensions:
+        cmd += ['-g', f'*{ext}']
+    for skipped_dir in skipped_dirs:
+        cmd += ['-g', f'!{skipped_dir}']
+    cmd.append(search_path)
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError as e:
+        print(f"Failed to run ripgrep: {e}")
+        return None
+
+    # rg exits 1 when nothing matched, 2 on error
+    if result.returncode > 1:
+        return None
+
+    return {line for line in result.stdout.split('\n') if line}
+
+@functools.lru_cache(maxsize=None)
+def _annotation_matcher(annotations):
+    """
+    Build a matcher for the annotations once per set of annotations:
+    an Aho-Corasick automaton if pyahocorasick is installed, a regex otherwise.
+
+    :param annotations: Tuple of annotation strings (e.g. '@RestController')
+    :return: ahocorasick.Automaton or compiled regex pattern
+    """
+    if ahocorasick is None:
+        return re.compile('(?:' + '|'.join(re.escape(a) for a in annotations) + r')(?:\s|\(|$)')
+
+    automaton = ahocorasick.Automaton()
+    for annotation in annotations:
+        automaton.add_word(annotation, annotation)
+    automaton.make_automaton()
+    return automaton
+
+def has_annotation(content, annotations):
+    """
+    Check if content uses any of the annotations, followed by whitespace, "(" or the end of content
+    (so @Controller doesn't match @ControllerAdvice).
+
+    :param content: Source code as a string
+    :param annotations: Annotation strings to search for (e.g. '@RestController')
+    :return: True if any annotation is found, False otherwise
+    """
+    matcher = _annotation_matcher(tuple(annotations))
+    if ahocorasick is None:
+        return matcher.search(content) is not None
+
+    for end, _ in matcher.iter(content):
+        following = content[end + 1:end + 2]
+        if not following or following == '(' or following.isspace():
+            return True
+    return False
+
 def crawl_microservice(repo, microservice_path, search_patterns=None) -> dict:
     """
     Crawl a single microservice directory for controllers (excluding tests)
@@ -89,7 +347,8 @@ def crawl_microservice(repo, microservice_path, search_patterns=None) -> dict:
     :param repo: git.Repo object
     :param microservice_path: Relative path to microservice (e.g. 'igor', 'fiat')
     :param search_patterns: Optional patterns to identify controllers
-    :return: Dictionary with microservice analysis results that will be used by deeper analysis methods
+    :return: Dictionary with microservice analysis results that will be used by deeper analysis methods,
+             controller files are (relative path, extension w/o dot) tuples
     """
     if search_patterns is None:
         search_patterns = {
@@ -103,26 +362,30 @@ def crawl_microservice(repo, microservice_path, search_patterns=None) -> dict:
 
     repo_root = repo.working_dir
     microservice_full_path = os.path.join(repo_root, microservice_path)
-    print(f"\nCrawling {microservice_path}...")
-    print(f"   Full path: {microservice_full_path}")
-
     controller_files = []
+    messages = []
 
-    # Walk through microservice directory
-    for root, dirs, files in os.walk(microservice_full_path):
-        # Skip common build/cache dirs
-        dirs[:] = [d for d in dirs if d not in skipped_dirs]
+    # Narrow down which files need their content checked, None if rg unavailable
+    annotation_candidates = find_annotation_candidates(
+        microservice_full_path, search_patterns['annotations'], skipped_dirs, file_extensions)
 
+    # Extensions w/o the dot, to check with a single set lookup per file
+    extensions = frozenset(ext.lstrip('.') for ext in file_extensions)
+
+    # Walk through microservice directory, skipping common build/cache dirs
+    for root, dirs, files in _scan(microservice_full_path, skipped_dirs=skipped_dirs):
+        # root is already a full path, so join by concatenating
+        root_sep = root + os.sep
         for file in files:
+            file_base, dot, ext = file.rpartition('.')
             # If ends in undefined file extension, skip
-            if not any(file.endswith(ext) for ext in file_extensions):
+            if not dot or ext not in extensions:
                 continue
 
-            filepath = os.path.join(root, file)
+            filepath = root_sep + file
             is_controller = False
 
             # Check file name pattern (w/o extension)
-            file_base = os.path.splitext(file)[0]
             for suffix in search_patterns['file_suffixes']:
                 if file_base.endswith(suffix):
                     is_controller = True
@@ -137,26 +400,26 @@ def crawl_microservice(repo, microservice_path, search_patterns=None) -> dict:
             #             break
 
             # Check file content has controller annotations
-            if not is_controller:
+            if not is_controller and (annotation_candidates is None or filepath in annotation_candidates):
                 try:
                     with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
                         content = f.read()
                         content_no_comments = remove_java_comments(content)
-                        for annotation in search_patterns['annotations']:
-                            pattern = rf'{re.escape(annotation)}(?:\s|\(|$)'
-                            if re.search(pattern, content_no_comments):
-                                is_controller = True
-                                break
+                        is_controller = has_annotation(content_no_comments, search_patterns['annotations'])
                 except Exception as e:
-                    print(f"Failed to read {filepath}: {e}")
-                    print(f"Skipping {filepath}...")
+                    messages.append(f"Failed to read {filepath}: {e}")
+                    messages.append(f"Skipping {filepath}...")
                     continue
 
             if is_controller:
                 rel_path = os.path.relpath(filepath, repo_root)
-                controller_files.append(rel_path)
+                controller_files.append((rel_path, ext))
 
-    print(f"Found {len(controller_files)} controller files")
+    # Printed together once done, since microservices are crawled in parallel threads
+    messages.insert(0, f"\nCrawling {microservice_path}...\n"
+                       f"   Full path: {microservice_full_path}")
+    messages.append(f"Found {len(controller_files)} controller files")
+    print('\n'.join(messages))
 
     return_dict = {
         'microservice': microservice_path,
@@ -171,149 +434,355 @@ def has_valid_uri_javalang(annotation):
     :param annotation: javalang annotation node
     :return: True if has valid non-empty URI, False otherwise
     """
-    if not annotation.element:
+    element = annotation.element
+    if not element:
         return False
 
     # Handle single value annotation like @GetMapping("/users")
-    if isinstance(annotation.element, javalang.tree.Literal):
-        value = annotation.element.value
-        return value and value.strip() not in ['""', "''"]
+    if isinstance(element, javalang.tree.Literal):
+        return bool(element.value) and element.value.strip() not in _EMPTY_URIS
+
+    # Handle arrays like @GetMapping({"/users", "/all-users"})
+    # If any value in the array is non-empty, valid uri
+    if isinstance(element, javalang.tree.ElementArrayValue):
+        return any(isinstance(item, javalang.tree.Literal) and item.value
+                   and item.value.strip() not in _EMPTY_ARRAY_URIS
+                   for item in element.values)
 
     # Handle named params like @GetMapping(value = "/users") or path = "/users"
-    # Also handle arrays like @GetMapping({"/users", "/all-users"})
-    if isinstance(annotation.element, list):
-        for elem in annotation.element:
-            if isinstance(elem, javalang.tree.ElementValuePair):
-                if elem.name in ['value', 'path']:
-                    # Check if literal
-                    if isinstance(elem.value, javalang.tree.Literal):
-                        value = elem.value.value
-                        return value and value.strip() not in ['""', "''"]
-                    # Check if array of literals
-                    elif isinstance(elem.value, list):
-                        # If any value in the array is non-empty, valid uri
-                        for item in elem.value:
-                            if isinstance(item, javalang.tree.Literal):
-                                value = item.value
-                                if value and value.strip() not in ['""', "''", '{}']:
-                                    return True
+    if isinstance(element, list):
+        for elem in element:
+            if not isinstance(elem, javalang.tree.ElementValuePair) or elem.name not in _URI_PARAM_NAMES:
+                continue
+            # Check if literal
+            if isinstance(elem.value, javalang.tree.Literal):
+                return bool(elem.value.value) and elem.value.value.strip() not in _EMPTY_URIS
+            # Check if array of literals
+            if isinstance(elem.value, javalang.tree.ElementArrayValue):
+                if any(isinstance(item, javalang.tree.Literal) and item.value
+                       and item.value.strip() not in _EMPTY_ARRAY_URIS
+                       for item in elem.value.values):
+                    return True
+    return False
+
+def _is_member_method_tree_sitter(method):
+    """
+    Check if a tree-sitter method_declaration is declared in a type or nested member type,
+    like iter_method_declarations yields, rather than in an anonymous or local class
+    inside a method body.
+
+    :param method: tree-sitter method_declaration node
+    :return: True if every ancestor is a type declaration or type body
+    """
+    body = method.parent
+    while body is not None and body.type in _TREE_SITTER_TYPE_BODIES:
+        declaration = body.parent
+        if body.type == 'enum_body_declarations' and declaration is not None:
+            declaration = declaration.parent
+        if declaration is None or declaration.type not in _TREE_SITTER_TYPE_BODIES[body.type]:
+            return False
+        if declaration.parent is not None and declaration.parent.type == 'program':
+            return True
+        body = declaration.parent
+    return False
+
+def _node_text(node):
+    """
+    Source text of a tree-sitter node, which is parsed from the raw file bytes.
+
+    :param node: tree-sitter node
+    :return: Node text as a string, skipping any invalid UTF-8
+    """
+    return node.text.decode('utf-8', errors='ignore')
+
+def _is_literal_tree_sitter(node):
+    """
+    Check if a tree-sitter node is a literal (string, number, char, boolean or null).
+
+    :param node: tree-sitter node
+    :return: True if node is a literal
+    """
+    return node.type.endswith('_literal') or node.type in ('true', 'false')
+
+def _has_valid_uri_array_tree_sitter(array):
+    """
+    Check if any literal in a tree-sitter array initializer is a non-empty URI.
+
+    :param array: tree-sitter element_value_array_initializer node
+    :return: True if any value in the array is non-empty
+    """
+    return any(_is_literal_tree_sitter(item) and _node_text(item).strip() not in _EMPTY_ARRAY_URIS
+               for item in array.named_children)
+
+def has_valid_uri_tree_sitter(arguments):
+    """
+    Check if annotation arguments have a non-empty URI/path parm.
+    Mirrors has_valid_uri_javalang for tree-sitter nodes.
+    :param arguments: tree-sitter annotation_argument_list node
+    :return: True if has valid non-empty URI, False otherwise
+    """
+    for elem in arguments.named_children:
+        if elem.type in ('line_comment', 'block_comment'):
+            continue
+
+        # Handle named params like @GetMapping(value = "/users") or path = "/users"
+        if elem.type == 'element_value_pair':
+            if _node_text(elem.child_by_field_name('key')) not in _URI_PARAM_NAMES:
+                continue
+            value = elem.child_by_field_name('value')
+            if _is_literal_tree_sitter(value):
+                return _node_text(value).strip() not in _EMPTY_URIS
+            if value.type == 'element_value_array_initializer' and _has_valid_uri_array_tree_sitter(value):
+                return True
+            continue
+
+        # Handle single value annotation like @GetMapping("/users")
+        if _is_literal_tree_sitter(elem):
+            return _node_text(elem).strip() not in _EMPTY_URIS
+
+        # Handle arrays like @GetMapping({"/users", "/all-users"})
+        if elem.type == 'element_value_array_initializer':
+            return _has_valid_uri_array_tree_sitter(elem)
+        return False
+
     return False
 
-def count_endpoints_in_file(file_path) -> list:
+def _report(message):
+    """
+    Print a message, or buffer it to be returned with the result when in a pool worker.
+
+    :param message: Message to print
+    """
+    if _worker_messages is None:
+        print(message)
+    else:
+        _worker_messages.append(message)
+
+def load_endpoint_cache(cache_file=_CACHE_FILE) -> dict:
+    """
+    Load the parsed endpoint cache written by a previous run.
+
+    :param cache_file: Path to cache file
+    :return: Dictionary of (file extension, content hash) -> endpoints, empty if missing, stale or invalid
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = pickle.load(f)
+
+        if not isinstance(cache, dict) or not isinstance(cache.get('entries'), dict):
+            raise ValueError('not an endpoint cache')
+        if cache.get('version') != _CACHE_VERSION or cache.get('backend') != _CACHE_BACKEND:
+            return {}
+        return cache['entries']
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Failed to load endpoint cache {cache_file}: {e}")
+        return {}
+
+def save_endpoint_cache(entries, cache_file=_CACHE_FILE):
+    """
+    Save the parsed endpoint cache for the next run.
+
+    :param entries: Dictionary of (file extension, content hash) -> endpoints
+    :param cache_file: Path to cache file
+    """
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump({'version': _CACHE_VERSION, 'backend': _CACHE_BACKEND, 'entries': entries}, f)
+    except Exception as e:
+        print(f"Failed to save endpoint cache {cache_file}: {e}")
+
+def count_endpoints_in_file(file_path, rel_path, file_ext) -> list:
     """
     Count valid endpoints in a single controller file.
-    Handles Java with javalang and Groovy/Kotlin (.groovy, .kt) with regex
+    Handles Java with tree-sitter if installed, javalang otherwise, and Groovy/Kotlin (.groovy, .kt) with regex.
+    Files whose content was already parsed (this run or a cached run) are not parsed again.
 
     :param file_path: Full path to the controller file
-    :return: List of endpoint dictionaries with method name and annotation type
+    :param rel_path: Path to the controller file relative to the repo, recorded on each endpoint
+    :param file_ext: File extension w/o the dot, as matched by crawl_microservice (e.g. 'java')
+    :return: List of endpoint dictionaries with method name, annotation type and file
     """
     endpoints = []
-    file_ext = os.path.splitext(file_path)[1].lower()
 
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-
-        # Use javalang for java files
-        if file_ext == '.java':
-            endpoints = count_endpoints_java(file_path, content)
+        # Map the file rather than reading it, so the checks below run on the
+        # page cache and only files that need parsing are copied and decoded
+        with open(file_path, 'rb') as f:
+            # Empty files can't be mapped, and have no endpoints anyway
+            if os.fstat(f.fileno()).st_size == 0:
+                return endpoints
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                # Every endpoint annotation ends in "Mapping", skip parsing files without one
+                if data.find(b'Mapping') == -1:
+                    return endpoints
+
+                cache_key = (file_ext, hashlib.blake2b(data, digest_size=16).digest())
+                if cache_key in _endpoint_cache:
+                    cached = _endpoint_cache[cache_key]
+                    _used_cache_entries[cache_key] = cached
+                    # Same content may be cached from another file
+                    return [{**endpoint, 'file': rel_path} for endpoint in cached]
+
+                source = data[:]
+
+        # Use tree-sitter or javalang for java files
+        if file_ext == 'java':
+            endpoints = count_endpoints_java(file_path, source, rel_path)
         else:
             # Use regex for Groovy, Kotlin, Scala, or other JVM lang
-            endpoints = count_endpoints_regex(file_path, content)
+            endpoints = count_endpoints_regex(file_path, source.decode('utf-8', errors='ignore'), rel_path)
+
+        _endpoint_cache[cache_key] = endpoints
+        _used_cache_entries[cache_key] = endpoints
     except Exception as e:
-        print(f"Failed to count endpoints: {e}")
+        _report(f"Failed to count endpoints: {e}")
 
     return endpoints
 
-def count_endpoints_java(file_path, content):
+def _init_worker(cache):
+    """
+    Process pool initializer, gives each worker the cache loaded by the main process
+    and starts buffering its messages.
+
+    :param cache: Dictionary of (file extension, content hash) -> endpoints
+    """
+    global _worker_messages
+    _endpoint_cache.update(cache)
+    _worker_messages = []
+
+def _count_endpoints_task(file_path, rel_path, file_ext):
+    """
+    Process pool task, counts endpoints in a file and hands back the cache entries
+    it hit or created and its messages.
+
+    :param file_path: Full path to the controller file
+    :param rel_path: Path to the controller file relative to the repo
+    :param file_ext: File extension w/o the dot
+    :return: Tuple of (endpoints, used cache entries, messages)
+    """
+    endpoints = count_endpoints_in_file(file_path, rel_path, file_ext)
+    used_entries = dict(_used_cache_entries)
+    _used_cache_entries.clear()
+    messages = list(_worker_messages)
+    _worker_messages.clear()
+    return endpoints, used_entries, messages
+
+def iter_method_declarations(type_declarations):
+    """
+    Yield the methods declared in the given types and their nested member types.
+    Unlike tree.filter, this doesn't descend into method bodies, which can't declare endpoints.
+
+    :param type_declarations: javalang type declaration nodes (e.g. tree.types)
+    :return: Generator of javalang MethodDeclaration nodes, in source order
+    """
+    for declaration in type_declarations:
+        body = declaration.body
+        # Enum members live after the constants
+        if isinstance(body, javalang.tree.EnumBody):
+            body = body.declarations
+
+        for member in body or []:
+            if isinstance(member, javalang.tree.MethodDeclaration):
+                yield member
+            elif isinstance(member, javalang.tree.TypeDeclaration):
+                yield from iter_method_declarations([member])
+
+def count_endpoints_java(file_path, source, rel_path):
     """
-    Count endpoints in Java files using javalang AST parsing
+    Count endpoints in Java files using tree-sitter if installed, javalang AST parsing otherwise
 
     :param file_path: Full path to file
-    :param content: File content as string
+    :param source: File content as bytes
+    :param rel_path: Path to file relative to the repo, recorded on each endpoint
     :return: List of endpoint dictionaries
     """
+    if _java_parser is not None:
+        return count_endpoints_tree_sitter(file_path, source, rel_path)
+
+    content = source.decode('utf-8', errors='ignore')
     endpoints = []
     try:
         tree = javalang.parse.parse(content)
 
-        for path, node in tree.filter(javalang.tree.MethodDeclaration):
+        for node in iter_method_declarations(tree.types):
             if node.annotations:
                 for annotation in node.annotations:
-                    if annotation.name in ['GetMapping', 'PostMapping',
-                                           'PutMapping', 'DeleteMapping',
-                                           'PatchMapping','RequestMapping']:
+                    if annotation.name in _MAPPING_ANNOTATIONS:
                         if has_valid_uri_javalang(annotation):
                             endpoints.append({
                                 'method': node.name,
-                                'annotation': annotation.name
+                                'annotation': annotation.name,
+                                'file': rel_path
                             })
     except javalang.parser.JavaSyntaxError as e:
-        print(f"Syntax error parsing {file_path}: {e}")
-        print(f"Falling back to regex parsing for {file_path}...")
-        endpoints = count_endpoints_regex(file_path, content)
+        _report(f"Syntax error parsing {file_path}: {e}\n"
+                f"Falling back to regex parsing for {file_path}...")
+        endpoints = count_endpoints_regex(file_path, content, rel_path)
     except Exception as e:
-        print(f"Failed to count endpoints: {e}")
+        _report(f"Failed to count endpoints: {e}")
 
     return endpoints
 
+def count_endpoints_tree_sitter(file_path, source, rel_path):
+    """
+    Count endpoints in Java files using tree-sitter parsing
 
-def count_endpoints_regex(file_path, content):
+    :param file_path: Full path to file
+    :param source: File content as bytes, parsed as is
+    :param rel_path: Path to file relative to the repo, recorded on each endpoint
+    :return: List of endpoint dictionaries
+    """
+    endpoints = []
+    try:
+        tree = _java_parser.parse(source)
+
+        # tree-sitter recovers from syntax errors, fall back like javalang does
+        if tree.root_node.has_error:
+            _report(f"Syntax error parsing {file_path}\n"
+                    f"Falling back to regex parsing for {file_path}...")
+            return count_endpoints_regex(file_path, source.decode('utf-8', errors='ignore'), rel_path)
+
+        for _, captures in _ENDPOINT_QUERY.matches(tree.root_node):
+            annotation_name = _node_text(captures['annotation'])
+            # Skip methods of anonymous and local classes, like the javalang walk does
+            if not _is_member_method_tree_sitter(captures['method'].parent):
+                continue
+            if annotation_name in _MAPPING_ANNOTATIONS:
+                if has_valid_uri_tree_sitter(captures['arguments']):
+                    endpoints.append({
+                        'method': _node_text(captures['method']),
+                        'annotation': annotation_name,
+                        'file': rel_path
+                    })
+    except Exception as e:
+        _report(f"Failed to count endpoints: {e}")
+
+    return endpoints
+
+
+def count_endpoints_regex(file_path, content, rel_path):
     """
     Count endpoints using regex pattern matching.
     Meant for Groovy, Kotlin, Scala, or fallback for failed Java parses
 
     :param file_path: full path to file
     :param content: file content as string
+    :param rel_path: path to file relative to the repo, recorded on each endpoint
     :return: list of endpoint dictionaries
     """
     endpoints = []
 
-    mapping_annotations = [
-        'GetMapping', 'PostMapping', 'PutMapping',
-        'DeleteMapping', 'PatchMapping', 'RequestMapping'
-    ]
-
-    # Attempts to match patterns like:
-    # @GetMapping("/users")
-    # @PostMapping(value = "/users")
-    # @RequestMapping(path = "/api/users")
-    # @GetMapping(["/users", "/all-users"])
-    # @GetMapping(value = ["/users", "/all-users"])
-    for annotation_name in mapping_annotations:
-        # Pattern explanation:
-        # @AnnotationName - the annotation
-        # \s* - optional whitespace
-        # \( - opening parenthesis
-        # (?:value\s*=\s*|path\s*=\s*)? - optional "value =" or "path ="
-        # (["'][^"']+["']|\[.*?\]) - capture either a string or an array
-        # [^)]* - any other parameters
-        # \) - closing parenthesis
-
-        # Simple string value @GetMapping("/path")
-        pattern1 = rf'@{annotation_name}\s*\(\s*(?:value\s*=\s*|path\s*=\s*)?(["\']).+?\1'
-
-        # Array value @GetMapping(["/path1", "/path2"])
-        pattern2 = rf'@{annotation_name}\s*\(\s*(?:value\s*=\s*|path\s*=\s*)?\[.+?\]'
-
-        # Find all matches for both patterns
-        matches1 = re.finditer(pattern1, content, re.DOTALL)
-        matches2 = re.finditer(pattern2, content, re.DOTALL)
-
-        # Count matches and attempt method name extraction
-        for match in matches1:
-            method_name = extract_method_name_near_annotation(content, match.start())
-            endpoints.append({
-                'method': method_name or 'unknown',
-                'annotation': annotation_name
-            })
-
-        for match in matches2:
-            method_name = extract_method_name_near_annotation(content, match.start())
-            endpoints.append({
-                'method': method_name or 'unknown',
-                'annotation': annotation_name
-            })
+    for match in _MAPPING_RE.finditer(content):
+        # Attempt method name extraction
+        method_name = extract_method_name_near_annotation(content, match.start())
+        endpoints.append({
+            'method': method_name or 'unknown',
+            'annotation': match.group('ann'),
+            'file': rel_path
+        })
 
     return endpoints
 
@@ -326,23 +795,26 @@ def extract_method_name_near_annotation(content, annotation_pos):
     :return: Method name or None if not found
     """
     snippet = content[annotation_pos:annotation_pos + 500]
-    method_pattern = r'(?:public|private|protected)?\s+(?:static\s+)?(?:\w+(?:<[^>]+>)?(?:\[\])?\s+)?(\w+)\s*\('
 
-    match = re.search(method_pattern, snippet)
+    match = _METHOD_RE.search(snippet)
     if match:
         return match.group(1)
 
     return None
 
-def analyze_microservice_endpoints(repo, microservice_path):
+def analyze_microservice_endpoints(repo, microservice_path, crawl_results=None, endpoints_by_file=None):
     """
     Crawl a microservice and count all valid endpoints
 
     :param repo: git.Repo object
     :param microservice_path: Relative path to microservice
+    :param crawl_results: Optional results of crawl_microservice, crawls again if not given
+    :param endpoints_by_file: Optional dict of controller relative path -> endpoints already
+                              counted elsewhere (e.g. in a process pool), counts serially if not given
     :return: Dictionary with detailed analysis
     """
-    crawl_results = crawl_microservice(repo, microservice_path)
+    if crawl_results is None:
+        crawl_results = crawl_microservice(repo, microservice_path)
 
     if crawl_results is None:
         return None
@@ -351,31 +823,68 @@ def analyze_microservice_endpoints(repo, microservice_path):
     all_endpoints = []
 
     print(f"Analyzing endpoints in {microservice_path}...")
+    messages = []
 
-    for controller_rel_path in crawl_results['controller_files']:
-        controller_full_path = os.path.join(repo_root, controller_rel_path)
-        file_endpoints = count_endpoints_in_file(controller_full_path)
+    for controller_rel_path, controller_ext in crawl_results['controller_files']:
+        if endpoints_by_file is not None:
+            file_endpoints = endpoints_by_file.get(controller_rel_path, [])
+        else:
+            controller_full_path = os.path.join(repo_root, controller_rel_path)
+            file_endpoints = count_endpoints_in_file(controller_full_path, controller_rel_path, controller_ext)
 
-        # Add file info to endpoint
-        for endpoint in file_endpoints:
-            endpoint['file'] = controller_rel_path
-            all_endpoints.append(endpoint)
+        all_endpoints.extend(file_endpoints)
 
         if file_endpoints:
-            print(f"{os.path.basename(controller_rel_path)}: {len(file_endpoints)} endpoints")
+            messages.append(f"{os.path.basename(controller_rel_path)}: {len(file_endpoints)} endpoints")
+
+    if messages:
+        print('\n'.join(messages))
 
     return {
         'microservice': microservice_path,
-        'controller_files': crawl_results['controller_files'],
+        'controller_files': [rel_path for rel_path, _ in crawl_results['controller_files']],
         'total_controllers': len(crawl_results['controller_files']),
         'total_endpoints': len(all_endpoints),
         'endpoints': all_endpoints
     }
 
 
+def count_endpoints_parallel(repo, crawls):
+    """
+    Count endpoints for every controller file across all crawled microservices
+    in a process pool, since javalang parsing is CPU-bound.
+
+    :param repo: git.Repo object
+    :param crawls: List of crawl_microservice results
+    :return: Dictionary of controller relative path -> list of endpoint dictionaries
+    """
+    repo_root = repo.working_dir
+    controller_files = [controller for crawl in crawls for controller in crawl['controller_files']]
+    rel_paths = [rel_path for rel_path, _ in controller_files]
+    file_exts = [ext for _, ext in controller_files]
+    full_paths = [os.path.join(repo_root, rel_path) for rel_path in rel_paths]
+
+    endpoints_by_file = {}
+    messages = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker,
+                             initargs=(_endpoint_cache,)) as executor:
+        results = executor.map(_count_endpoints_task, full_paths, rel_paths, file_exts, chunksize=16)
+        for rel_path, (endpoints, used_entries, file_messages) in zip(rel_paths, results):
+            endpoints_by_file[rel_path] = endpoints
+            _endpoint_cache.update(used_entries)
+            _used_cache_entries.update(used_entries)
+            messages.extend(file_messages)
+
+    if messages:
+        print('\n'.join(messages))
+
+    return endpoints_by_file
+
+
 def main():
     repo = clone_repo('https://github.com/spinnaker/spinnaker.git')
     repo_dirs = get_microservice_dirs(repo)
+    _endpoint_cache.update(load_endpoint_cache())
 
     all_results = []
 
@@ -383,8 +892,14 @@ def main():
     print("ANALYZING MICROSERVICES")
     print("=" * 60)
 
-    for microservice_path in repo_dirs:
-        results = analyze_microservice_endpoints(repo, microservice_path)
+    # Crawling is mostly I/O (scandir, reads, rg subprocesses) which releases the GIL,
+    # so microservices are crawled in threads
+    with ThreadPoolExecutor(max_workers=len(repo_dirs) or 1) as executor:
+        crawls = list(executor.map(lambda microservice_path: crawl_microservice(repo, microservice_path), repo_dirs))
+    endpoints_by_file = count_endpoints_parallel(repo, crawls)
+
+    for microservice_path, crawl_results in zip(repo_dirs, crawls):
+        results = analyze_microservice_endpoints(repo, microservice_path, crawl_results, endpoints_by_file)
         if results:
             all_results.append(results)
 
@@ -404,9 +919,15 @@ def main():
         print(
             f"  {result['microservice']:30s} - {result['total_endpoints']:3d} endpoints from {result['total_controllers']:2d} controllers")
 
-    with open('spinnaker_analysis.json', 'w') as f:
-        json.dump(all_results, f, indent=2)
+    if orjson is not None:
+        with open('spinnaker_analysis.json', 'wb') as f:
+            f.write(orjson.dumps(all_results, option=orjson.OPT_INDENT_2))
+    else:
+        with open('spinnaker_analysis.json', 'w') as f:
+            f.write(json.dumps(all_results, indent=2))
     print("\nDetailed results saved to 'spinnaker_analysis.json'")
+
+    save_endpoint_cache(_used_cache_entries)
     return all_results
 
 if __name__ == '__main__':